@@ -1,21 +1,22 @@
 import sys
 import os
+from datetime import datetime, timedelta
 
 # Adding src to path so we can import our modules
 sys.path.append(os.path.join(os.getcwd(), "src"))
 
-from ingestion.scraper import PropertyIngestor
-from ingestion.converter import DataConverter
-from remediation.cleaner import DataCleaner
+# Banners are built once and emitted with a single stdout write each
+RULE = "=" * 50
+PIPELINE_BANNER = f"\n{RULE}\n      REAL ESTATE DATA QUALITY PIPELINE (MEMBER 1)\n{RULE}\n\n"
 
 def run_pipeline():
-    print("\n" + "="*50)
-    print("      REAL ESTATE DATA QUALITY PIPELINE (MEMBER 1)")
-    print("="*50 + "\n")
+    sys.stdout.write(PIPELINE_BANNER)
 
     try:
         # Step 1: Ingestion
         print("[STEP 1/3] Starting Data Ingestion...")
+        # Stage modules pull in pandas/bs4, so each is imported only once its step runs
+        from ingestion.scraper import PropertyIngestor
         ingestor = PropertyIngestor()
         
         # Capture user dates for the entire pipeline
@@ -25,7 +26,6 @@ def run_pipeline():
         user_end = input("  Enter End Date   [Enter for default]: ")
         
         # Fallbacks (logic matching scraper)
-        from datetime import datetime, timedelta
         if not user_start: user_start = (datetime.now() - timedelta(days=15)).strftime("%Y-%m-%d")
         if not user_end: user_end = datetime.now().strftime("%Y-%m-%d")
         
@@ -38,18 +38,18 @@ def run_pipeline():
 
         # Step 2: Unification/Conversion
         print("\n[STEP 2/3] Transforming Raw Data to Unified CSV...")
+        from ingestion.converter import DataConverter
         converter = DataConverter()
-        converter.unify_to_csv()
+        unified_df = converter.unify_to_csv()
 
         # Step 3: Remediation/Cleaning
         print("\n[STEP 3/3] Running Data Remediation (Auto-Fix)...")
+        from remediation.cleaner import DataCleaner
         cleaner = DataCleaner()
-        cleaned_file = cleaner.run_remediation()
+        cleaned_file = cleaner.run_remediation(unified_df)
 
-        print("\n" + "="*50)
-        print("✅ PIPELINE SUCCESSFUL!")
-        print(f"Final Cleaned Dataset: {os.path.basename(cleaned_file)}")
-        print("="*50 + "\n")
+        sys.stdout.write(f"\n{RULE}\n✅ PIPELINE SUCCESSFUL!\n"
+                         f"Final Cleaned Dataset: {os.path.basename(cleaned_file)}\n{RULE}\n\n")
 
     except Exception as e:
         print(f"\n[❌] PIPELINE FAILED: {str(e)}")
@@ -1,90 +1,111 @@
 import os
-import json
+import orjson
 import pandas as pd
 from bs4 import BeautifulSoup
 from datetime import datetime
 
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+RAW_DIR = os.path.join(BASE_DIR, "data", "raw")
+PROCESSED_DIR = os.path.join(BASE_DIR, "data", "processed")
+
+# Column order of the Unified Schema every parser emits
+UNIFIED_COLUMNS = ["address", "price", "listed_date", "source", "ingested_at"]
+
 class DataConverter:
     """
     Member 1's Task: The Converter.
     Unifies disparate raw formats (JSON, HTML) into a single Structured CSV.
     """
     def __init__(self):
-        # Discover base directory
-        self.base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        self.raw_dir = os.path.join(self.base_dir, "data", "raw")
-        self.output_dir = os.path.join(self.base_dir, "data", "processed")
-        
-        if not os.path.exists(self.output_dir):
-            os.makedirs(self.output_dir)
+        self.base_dir = BASE_DIR
+        self.raw_dir = RAW_DIR
+        self.output_dir = PROCESSED_DIR
+        # Listing of raw_dir shared by every parser during one unify_to_csv run
+        self._raw_names = None
+
+        os.makedirs(self.output_dir, exist_ok=True)
 
     def _get_latest_file(self, prefix, extension):
         """Finds the most recent file for a given source for Lineage."""
-        files = [f for f in os.listdir(self.raw_dir) if f.startswith(prefix) and f.endswith(extension)]
-        if not files:
-            return None
-        return os.path.join(self.raw_dir, sorted(files)[-1])
+        # Snapshot names embed a sortable timestamp, so the newest is simply the
+        # max name - one pass, no list or sort.
+        names = self._raw_names
+        if names is None:
+            names = (entry.name for entry in os.scandir(self.raw_dir))
+        latest = max(
+            (name for name in names if name.startswith(prefix) and name.endswith(extension)),
+            default=None,
+        )
+        return os.path.join(self.raw_dir, latest) if latest else None
 
     def parse_api_json(self):
         """Extracts property data from the Zillow API JSON."""
         file_path = self._get_latest_file("api_zillow", "json")
         if not file_path:
-            return []
+            return pd.DataFrame(columns=UNIFIED_COLUMNS)
             
         print(f"[*] Parsing JSON: {os.path.basename(file_path)}...")
-        with open(file_path, "r") as f:
-            data = json.load(f)
+        with open(file_path, "rb") as f:
+            data = orjson.loads(f.read())
         
-        # Mapping API keys to our Unified Schema
-        standardized = []
-        for prop in data.get("properties", []):
-            standardized.append({
-                "address": prop.get("add"),
-                "price": prop.get("price"),
-                "listed_date": prop.get("listed_date"),
-                "source": "Zillow_API",
-                "ingested_at": datetime.now().isoformat()
-            })
-        return standardized
+        # Mapping API keys to our Unified Schema, built column-wise in one frame
+        df = pd.DataFrame(data.get("properties", []), columns=["add", "price", "listed_date"])
+        df = df.rename(columns={"add": "address"})
+        df["source"] = "Zillow_API"
+        df["ingested_at"] = datetime.now().isoformat()  # one stamp per ingestion run, not per record
+        return df
 
     def parse_city_html(self):
         """Scrapes property data from the City Records HTML table."""
         file_path = self._get_latest_file("city_records", "html")
         if not file_path:
-            return []
+            return pd.DataFrame(columns=UNIFIED_COLUMNS)
 
         print(f"[*] Parsing HTML: {os.path.basename(file_path)}...")
         with open(file_path, "r", encoding="utf-8") as f:
-            soup = BeautifulSoup(f.read(), "html.parser")
+            soup = BeautifulSoup(f.read(), "lxml")
         
         table_rows = soup.find_all("tr")[1:] # Skip header row
-        standardized = []
+        addresses, listed_dates = [], []
         for row in table_rows:
             cols = row.find_all("td")
-            standardized.append({
-                "address": cols[0].text,
-                "price": None,
-                "listed_date": cols[2].text if len(cols) > 2 else None,
-                "source": "City_Records",
-                "ingested_at": datetime.now().isoformat()
-            })
-        return standardized
+            addresses.append(cols[0].text)
+            listed_dates.append(cols[2].text if len(cols) > 2 else None)
+
+        # City records carry no price; NaN keeps the column numeric like the API's
+        return pd.DataFrame({
+            "address": addresses,
+            "price": float("nan"),
+            "listed_date": listed_dates,
+            "source": "City_Records",
+            "ingested_at": datetime.now().isoformat()
+        })
 
     def unify_to_csv(self):
-        """Combines all sources and saves to /data/processed/raw_structured.csv."""
-        all_data = self.parse_api_json() + self.parse_city_html()
-        
-        if not all_data:
+        """
+        Combines all sources and saves to /data/processed/raw_structured.csv.
+        Returns the unified DataFrame so the next stage can use it without re-reading the CSV.
+        """
+        # raw_dir is listed once up front instead of once per parser
+        self._raw_names = [entry.name for entry in os.scandir(self.raw_dir)]
+        try:
+            frames = [df for df in (self.parse_api_json(), self.parse_city_html()) if not df.empty]
+        finally:
+            self._raw_names = None
+
+        if not frames:
             print("[!] No data found to convert.")
             return
 
-        df = pd.DataFrame(all_data)
+        # Every parser already emits the Unified Schema, so concat just stacks columns;
+        # a lone source is written as-is
+        df = frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True, sort=False)
         output_path = os.path.join(self.output_dir, "raw_structured.csv")
         df.to_csv(output_path, index=False)
         
         print(f"[+] Success! Unified dataset created at: {output_path}")
         print(df)
-        return output_path
+        return df
 
 if __name__ == "__main__":
     converter = DataConverter()
@@ -1,9 +1,14 @@
 import requests
 import os
-import pandas as pd
-import json
+import orjson
+import shutil
 from datetime import datetime, timedelta
 
+# Senior Engineer Trick: Find the Project Root automatically (once, at import)
+# Resolves to: c:\Users\Varshini J\Desktop\project 3 - gesix solutions\
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+RAW_DIR = os.path.join(BASE_DIR, "data", "raw")
+
 class PropertyIngestor:
     """
     The Universal Ingestion Engine for the Data Quality Framework.
@@ -12,22 +17,26 @@ class PropertyIngestor:
     including Live APIs, Public City Records, and Manual CSV Uploads.
     """
     def __init__(self):
-        # Senior Engineer Trick: Find the Project Root automatically
-        # Resolves to: c:\Users\Varshini J\Desktop\project 3 - gesix solutions\
-        base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        self.raw_dir = os.path.join(base_dir, "data", "raw")
-        
-        if not os.path.exists(self.raw_dir):
-            os.makedirs(self.raw_dir)
+        self.raw_dir = RAW_DIR
+
+        os.makedirs(self.raw_dir, exist_ok=True)
+
+    def _raw_path(self, source_name, extension):
+        """Builds the timestamped archive path used for Lineage tracking."""
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        return os.path.join(self.raw_dir, f"{source_name}_{timestamp}.{extension}")
 
     def _save_raw(self, content, source_name, extension="html"):
         """Utility to save raw data with a timestamp for Lineage tracking."""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{source_name}_{timestamp}.{extension}"
-        filepath = os.path.join(self.raw_dir, filename)
+        filepath = self._raw_path(source_name, extension)
         
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write(str(content))
+        # Already-encoded payloads (e.g. orjson output) are written as-is, without a decode
+        if isinstance(content, bytes):
+            with open(filepath, "wb") as f:
+                f.write(content)
+        else:
+            with open(filepath, "w", encoding="utf-8") as f:
+                f.write(str(content))
         
         print(f"[+] Raw data archived: {filepath}")
         return filepath
@@ -70,7 +79,7 @@ class PropertyIngestor:
                     })
             
             print(f"[*] API Filtered: {len(properties)} records found.")
-            mock_json = json.dumps({"properties": properties})
+            mock_json = orjson.dumps({"properties": properties})
             return self._save_raw(mock_json, "api_zillow", "json")
         except Exception as e:
             print(f"[!] API Error: {e}")
@@ -126,13 +135,15 @@ class PropertyIngestor:
         """
         print(f"[*] Processing user upload: {local_file_path}...")
         try:
-            # Copying the user file to our raw data repository for Lineage
-            if os.path.exists(local_file_path):
-                df = pd.read_csv(local_file_path)
-                return self._save_raw(df.to_csv(), "user_upload", "csv")
-            else:
-                print("[!] Error: File not found.")
-                return None
+            # Copying the user file byte-for-byte to our raw data repository for Lineage;
+            # copyfile uses the kernel's sendfile fast path instead of a pandas parse + re-write
+            filepath = self._raw_path("user_upload", "csv")
+            shutil.copyfile(local_file_path, filepath)
+            print(f"[+] Raw data archived: {filepath}")
+            return filepath
+        except FileNotFoundError:
+            print("[!] Error: File not found.")
+            return None
         except Exception as e:
             print(f"[!] Upload Error: {e}")
             return None
@@ -1,21 +1,26 @@
 import pandas as pd
 import os
 
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+PROCESSED_DIR = os.path.join(BASE_DIR, "data", "processed")
+
 class DataCleaner:
     """
     Member 1's Task: The Remediation Engine.
     Takes 'Dirty' unified data and applies auto-fixes and standardization.
     """
     def __init__(self):
-        self.base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        self.input_file = os.path.join(self.base_dir, "data", "processed", "raw_structured.csv")
-        self.output_file = os.path.join(self.base_dir, "data", "processed", "cleaned_data.csv")
+        self.base_dir = BASE_DIR
+        self.input_file = os.path.join(PROCESSED_DIR, "raw_structured.csv")
+        self.output_file = os.path.join(PROCESSED_DIR, "cleaned_data.csv")
 
     def load_data(self):
-        if not os.path.exists(self.input_file):
+        try:
+            # memory_map reads straight from the mapped file instead of buffering a copy
+            return pd.read_csv(self.input_file, memory_map=True)
+        except FileNotFoundError:
             print(f"[!] Error: Target file {self.input_file} not found.")
             return None
-        return pd.read_csv(self.input_file)
 
     def standardize_addresses(self, df):
         """Removes whitespace and standardizes common abbreviations (Format Validity)."""
@@ -37,8 +42,10 @@ class DataCleaner:
         df.loc[mask, 'remediation_notes'] = "Price invalid or missing - flagged for review"
         return df
 
-    def run_remediation(self):
-        df = self.load_data()
+    def run_remediation(self, df=None):
+        # The pipeline hands over the converter's frame in memory; only standalone runs re-read the CSV
+        if df is None:
+            df = self.load_data()
         if df is None: return
 
         # Apply Fixes